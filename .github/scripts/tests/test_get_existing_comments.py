@@ -1,15 +1,10 @@
 """Tests for get_existing_comments.py script."""
 
 import json
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from get_existing_comments import (
     run_gh,
     get_bot_review_comments,
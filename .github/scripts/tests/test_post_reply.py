@@ -1,15 +1,10 @@
 """Tests for post_reply.py script."""
 
 import json
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from post_reply import (
     run_gh,
     post_reply_to_review_comment,
@@ -2,16 +2,11 @@
 
 import json
 import subprocess
-import sys
 from io import StringIO
-from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from post_review import (
     InlineComment,
     ReviewPayload,
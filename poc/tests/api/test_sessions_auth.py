@@ -1,32 +1,21 @@
-from fastapi.testclient import TestClient
-from src.api.app import app
-
-client = TestClient(app)
-
-
-def test_create_session_requires_auth():
-    response = client.post("/v1/sessions")
-    assert response.status_code == 401
-
-
-def test_list_sessions_requires_auth():
-    response = client.get("/v1/sessions")
-    assert response.status_code == 401
-
-
-def test_session_detail_requires_auth():
-    response = client.get("/v1/sessions/test-session")
-    assert response.status_code == 401
-
-
-def test_send_message_requires_auth():
-    response = client.post(
-        "/v1/sessions/test-session/messages",
-        json={"message": "hello", "stream": False},
-    )
-    assert response.status_code == 401
-
-
-def test_delete_session_requires_auth():
-    response = client.delete("/v1/sessions/test-session")
+import pytest
+
+
+@pytest.mark.parametrize(
+    "method, path, body",
+    [
+        pytest.param("post", "/v1/sessions", None, id="create_session"),
+        pytest.param("get", "/v1/sessions", None, id="list_sessions"),
+        pytest.param("get", "/v1/sessions/test-session", None, id="session_detail"),
+        pytest.param(
+            "post",
+            "/v1/sessions/test-session/messages",
+            {"message": "hello", "stream": False},
+            id="send_message",
+        ),
+        pytest.param("delete", "/v1/sessions/test-session", None, id="delete_session"),
+    ],
+)
+async def test_session_endpoints_require_auth(async_client, method, path, body):
+    response = await async_client.request(method, path, json=body)
     assert response.status_code == 401
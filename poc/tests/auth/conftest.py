@@ -0,0 +1,19 @@
+import pytest
+from unittest.mock import AsyncMock
+
+
+@pytest.fixture(scope="session")
+def _supabase_template():
+    """auth 테스트 전체에서 공유하는 Supabase 클라이언트 mock"""
+    client = AsyncMock()
+    # auth.get_user returning a Response-like object
+    client.auth = AsyncMock()
+    client.auth.get_user = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def mock_supabase_client(_supabase_template):
+    """템플릿을 reset_mock으로 초기화해 재사용 (이전 테스트의 return_value/side_effect 제거)"""
+    _supabase_template.reset_mock(return_value=True, side_effect=True)
+    return _supabase_template
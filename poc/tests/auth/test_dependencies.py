@@ -2,6 +2,7 @@
 Unit tests for Auth dependencies
 """
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials
@@ -9,26 +10,47 @@ from fastapi.security import HTTPAuthorizationCredentials
 from src.auth.dependencies import verify_current_user, get_supabase_client
 from src.auth.schemas import User
 
+# Immutable credentials, built once per module
+VALID_TOKEN = HTTPAuthorizationCredentials(scheme="Bearer", credentials="valid_token")
+INVALID_TOKEN = HTTPAuthorizationCredentials(scheme="Bearer", credentials="invalid_token")
+ERROR_TOKEN = HTTPAuthorizationCredentials(scheme="Bearer", credentials="error_token")
+
+# Supabase auth.get_user response for a valid token
+SUPABASE_USER = SimpleNamespace(
+    id="user-123",
+    aud="authenticated",
+    role="authenticated",
+    email="test@example.com",
+    email_confirmed_at="2024-01-01T00:00:00Z",
+    created_at="2024-01-01T00:00:00Z",
+    updated_at="2024-01-01T00:00:00Z",
+    # Optional fields
+    phone=None,
+    confirmed_at=None,
+    last_sign_in_at=None,
+    app_metadata={},
+    user_metadata={},
+    identities=[],
+)
+
+# Plain async stand-ins for auth.get_user where no call assertions are needed
+async def _get_user_no_user(jwt):
+    return SimpleNamespace(user=None)
+
+async def _get_user_error(jwt):
+    raise Exception("Supabase Error")
+
 @pytest.fixture
 def mock_request():
     request = MagicMock(spec=Request)
     request.app.state.supabase = AsyncMock()
     return request
 
-@pytest.fixture
-def mock_supabase_client():
-    client = AsyncMock()
-    # Mock auth.get_user
-    client.auth.get_user = AsyncMock()
-    return client
-
-@pytest.mark.asyncio
 async def test_get_supabase_client(mock_request):
     """Test retrieving the global Supabase client"""
     client = get_supabase_client(mock_request)
     assert client == mock_request.app.state.supabase
 
-@pytest.mark.asyncio
 async def test_get_supabase_client_uninitialized():
     """Test retrieving client when not initialized raises 500"""
     request = MagicMock(spec=Request)
@@ -54,34 +76,12 @@ async def test_get_supabase_client_uninitialized():
     assert exc.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert "not initialized" in exc.value.detail
 
-@pytest.mark.asyncio
 async def test_verify_current_user_valid(mock_supabase_client):
     """Test successful token verification"""
-    token = HTTPAuthorizationCredentials(scheme="Bearer", credentials="valid_token")
-    
     # Mock successful Supabase response
-    mock_user = MagicMock()
-    mock_user.id = "user-123"
-    mock_user.aud = "authenticated"
-    mock_user.role = "authenticated"
-    mock_user.email = "test@example.com"
-    mock_user.email_confirmed_at = "2024-01-01T00:00:00Z"
-    mock_user.created_at = "2024-01-01T00:00:00Z"
-    mock_user.updated_at = "2024-01-01T00:00:00Z"
-    # Optional fields
-    mock_user.phone = None
-    mock_user.confirmed_at = None
-    mock_user.last_sign_in_at = None
-    mock_user.app_metadata = {}
-    mock_user.user_metadata = {}
-    mock_user.identities = []
+    mock_supabase_client.auth.get_user.return_value = SimpleNamespace(user=SUPABASE_USER)
 
-    mock_response = MagicMock()
-    mock_response.user = mock_user
-    
-    mock_supabase_client.auth.get_user.return_value = mock_response
-
-    user = await verify_current_user(token, mock_supabase_client)
+    user = await verify_current_user(VALID_TOKEN, mock_supabase_client)
 
     assert isinstance(user, User)
     assert user.id == "user-123"
@@ -89,28 +89,21 @@ async def test_verify_current_user_valid(mock_supabase_client):
     
     mock_supabase_client.auth.get_user.assert_called_once_with("valid_token")
 
-@pytest.mark.asyncio
-async def test_verify_current_user_invalid(mock_supabase_client):
-    """Test handling of invalid token"""
-    token = HTTPAuthorizationCredentials(scheme="Bearer", credentials="invalid_token")
-    
-    # Mock Supabase returning None/empty
-    mock_supabase_client.auth.get_user.return_value = MagicMock(user=None)
+@pytest.mark.parametrize(
+    "token, get_user, detail",
+    [
+        # Supabase returning None/empty
+        pytest.param(INVALID_TOKEN, _get_user_no_user, "Invalid authentication credentials", id="invalid"),
+        # Supabase raising exception
+        pytest.param(ERROR_TOKEN, _get_user_error, "Could not validate credentials", id="exception"),
+    ],
+)
+async def test_verify_current_user_rejected(mock_supabase_client, monkeypatch, token, get_user, detail):
+    """Test handling of invalid tokens and Supabase errors"""
+    monkeypatch.setattr(mock_supabase_client.auth, "get_user", get_user)
 
     with pytest.raises(HTTPException) as exc:
         await verify_current_user(token, mock_supabase_client)
-    
-    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
 
-@pytest.mark.asyncio
-async def test_verify_current_user_exception(mock_supabase_client):
-    """Test handling of Supabase errors"""
-    token = HTTPAuthorizationCredentials(scheme="Bearer", credentials="error_token")
-    
-    # Mock Supabase raising exception
-    mock_supabase_client.auth.get_user.side_effect = Exception("Supabase Error")
-
-    with pytest.raises(HTTPException) as exc:
-        await verify_current_user(token, mock_supabase_client)
-    
     assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert exc.value.detail == detail
@@ -1,61 +1,59 @@
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, MagicMock
-from src.api.app import app
+from types import SimpleNamespace
 from src.auth.dependencies import get_supabase_client
 
-client = TestClient(app)
+# Supabase user with actual attributes (not model_dump)
+SUPABASE_USER = SimpleNamespace(
+    id="user-123",
+    aud="authenticated",
+    role="authenticated",
+    email="test@example.com",
+    email_confirmed_at="2023-01-01T00:00:00Z",
+    phone=None,
+    confirmed_at="2023-01-01T00:00:00Z",
+    last_sign_in_at="2023-01-01T00:00:00Z",
+    app_metadata={"provider": "email"},
+    user_metadata={},
+    identities=[],
+    created_at="2023-01-01T00:00:00Z",
+    updated_at="2023-01-01T00:00:00Z",
+)
+
+
+# auth.get_user 대체용 async 함수 (호출 검증이 필요 없으므로 AsyncMock 대신 사용)
+async def _get_user_invalid(jwt):
+    raise Exception("Invalid Token")
+
+async def _get_user_valid(jwt):
+    return SimpleNamespace(user=SUPABASE_USER)
+
 
 @pytest.fixture
-def mock_supabase_client():
-    mock = AsyncMock()
-    # auth.get_user returning a Response-like object
-    mock.auth = AsyncMock()
-    return mock
-
-def test_get_me_without_token():
-    response = client.get("/v1/auth/me")
+def authed(api_app, mock_supabase_client):
+    """get_supabase_client를 mock으로 오버라이드한 뒤 mock 반환 (테스트 후 해당 키만 제거)"""
+    api_app.dependency_overrides[get_supabase_client] = lambda: mock_supabase_client
+    try:
+        yield mock_supabase_client
+    finally:
+        api_app.dependency_overrides.pop(get_supabase_client, None)
+
+async def test_get_me_without_token(async_client):
+    response = await async_client.get("/v1/auth/me")
     assert response.status_code == 401  # HTTPBearer auto_error returns 401 for missing credentials
 
-def test_get_me_with_invalid_token(mock_supabase_client):
-    app.dependency_overrides[get_supabase_client] = lambda: mock_supabase_client
-    
+async def test_get_me_with_invalid_token(async_client, authed, monkeypatch):
     # Setup mock to raise error or return invalid
-    mock_supabase_client.auth.get_user.side_effect = Exception("Invalid Token")
+    monkeypatch.setattr(authed.auth, "get_user", _get_user_invalid)
     
-    response = client.get("/v1/auth/me", headers={"Authorization": "Bearer invalid_token"})
+    response = await async_client.get("/v1/auth/me", headers={"Authorization": "Bearer invalid_token"})
     assert response.status_code == 401
-    
-    app.dependency_overrides = {}
-
-def test_get_me_success(mock_supabase_client):
-    app.dependency_overrides[get_supabase_client] = lambda: mock_supabase_client
-
-    # Setup mock user with actual attributes (not model_dump)
-    mock_user = MagicMock()
-    mock_user.id = "user-123"
-    mock_user.aud = "authenticated"
-    mock_user.role = "authenticated"
-    mock_user.email = "test@example.com"
-    mock_user.email_confirmed_at = "2023-01-01T00:00:00Z"
-    mock_user.phone = None
-    mock_user.confirmed_at = "2023-01-01T00:00:00Z"
-    mock_user.last_sign_in_at = "2023-01-01T00:00:00Z"
-    mock_user.app_metadata = {"provider": "email"}
-    mock_user.user_metadata = {}
-    mock_user.identities = []
-    mock_user.created_at = "2023-01-01T00:00:00Z"
-    mock_user.updated_at = "2023-01-01T00:00:00Z"
-
-    mock_response = MagicMock()
-    mock_response.user = mock_user
-    mock_supabase_client.auth.get_user.return_value = mock_response
-
-    response = client.get("/v1/auth/me", headers={"Authorization": "Bearer valid_token"})
+
+async def test_get_me_success(async_client, authed, monkeypatch):
+    monkeypatch.setattr(authed.auth, "get_user", _get_user_valid)
+
+    response = await async_client.get("/v1/auth/me", headers={"Authorization": "Bearer valid_token"})
 
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == "user-123"
     assert data["email"] == "test@example.com"
-
-    app.dependency_overrides = {}
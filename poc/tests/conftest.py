@@ -1,6 +1,53 @@
+import functools
 import os
 
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 os.environ.setdefault("SUPABASE_URL", "http://test.supabase.local")
 os.environ.setdefault("SUPABASE_ANON_KEY", "test-anon-key")
 os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "test-service-role-key")
+
+
+@pytest.fixture(scope="session")
+def _cache_typed_signatures():
+    """FastAPI get_typed_signature 결과를 캐시 (API 앱 fixture에서만 사용)
+
+    dependency_overrides가 있으면 FastAPI는 요청마다 모든 하위 의존성에 대해
+    get_dependant → inspect.signature를 다시 호출함. API 테스트는 대부분 오버라이드를
+    사용하므로 세션 동안 시그니처를 캐시. 헬퍼가 없거나 이미 캐시된 버전이면 그대로 둠.
+    FastAPI 비공개 헬퍼를 patch하므로 API 테스트는 운영 환경과 완전히 같은 코드 경로를 타지 않음.
+    테스트마다 새로 만드는 오버라이드 lambda(및 그 mock)가 계속 붙잡히지 않도록 캐시 크기를 제한
+    """
+    from fastapi.dependencies import utils
+
+    get_typed_signature = getattr(utils, "get_typed_signature", None)
+    if get_typed_signature is None or hasattr(get_typed_signature, "cache_info"):
+        yield
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(utils, "get_typed_signature", functools.lru_cache(maxsize=256)(get_typed_signature))
+        yield
+
+
+@pytest.fixture(scope="session")
+def api_app(_cache_typed_signatures):
+    """src.api.app 전체 앱 (세션 동안 공유)"""
+    from src.api.app import app
+
+    # OpenAPI 스키마를 미리 생성해 첫 테스트에 초기화 비용이 몰리지 않게 함
+    app.openapi()
+    return app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(api_app):
+    """전체 앱 AsyncClient (세션 동안 하나만 생성)
+
+    ASGITransport로 테스트 이벤트 루프에서 앱을 직접 구동.
+    lifespan은 실행하지 않음 (Supabase/Supervisor 초기화 불필요)
+    """
+    async with AsyncClient(transport=ASGITransport(app=api_app), base_url="http://test") as c:
+        yield c
@@ -23,9 +23,7 @@ def memory() -> SupabaseChatMemory:
 def _make_select_chain(data: list) -> MagicMock:
     """Helper: build .select().eq().eq().execute() mock chain returning given data."""
     async def mock_execute():
-        result = MagicMock()
-        result.data = data
-        return result
+        return MagicMock(data=data)
 
     eq2_mock = MagicMock()
     eq2_mock.execute = mock_execute
@@ -44,16 +42,13 @@ def _make_insert_chain(*, raises: Exception | None = None, data: list | None = N
     async def mock_execute():
         if raises:
             raise raises
-        result = MagicMock()
-        result.data = data or []
-        return result
+        return MagicMock(data=data or [])
 
     insert_mock = MagicMock()
     insert_mock.execute = mock_execute
     return insert_mock
 
 
-@pytest.mark.asyncio
 async def test_ensure_session_existing_session_returns_true(memory: SupabaseChatMemory):
     """Test that existing session owned by user returns True without INSERT"""
     mock_client = MagicMock()
@@ -75,7 +70,6 @@ async def test_ensure_session_existing_session_returns_true(memory: SupabaseChat
     table_mock.insert.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_ensure_session_insert_success(memory: SupabaseChatMemory):
     """Test successful session creation when session does not exist"""
     mock_client = MagicMock()
@@ -98,7 +92,6 @@ async def test_ensure_session_insert_success(memory: SupabaseChatMemory):
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_ensure_session_rls_hidden_duplicate_raises_access_denied(memory: SupabaseChatMemory):
     """Test that session hidden by RLS (SELECT empty, INSERT 23505) raises SessionAccessDenied"""
     mock_client = MagicMock()
@@ -122,7 +115,6 @@ async def test_ensure_session_rls_hidden_duplicate_raises_access_denied(memory:
         await memory._ensure_session(session_id, user_id, client=mock_client)
 
 
-@pytest.mark.asyncio
 async def test_ensure_session_other_db_error_raises_operation_error(memory: SupabaseChatMemory):
     """Test that non-APIError exceptions raise SupabaseOperationError"""
     mock_client = MagicMock()
@@ -144,7 +136,6 @@ async def test_ensure_session_other_db_error_raises_operation_error(memory: Supa
         await memory._ensure_session(session_id, user_id, client=mock_client)
 
 
-@pytest.mark.asyncio
 async def test_ensure_session_non_23505_api_error_raises_operation_error(memory: SupabaseChatMemory):
     """Test that APIError with code other than 23505 raises SupabaseOperationError"""
     mock_client = MagicMock()
@@ -168,7 +159,6 @@ async def test_ensure_session_non_23505_api_error_raises_operation_error(memory:
         await memory._ensure_session(session_id, user_id, client=mock_client)
 
 
-@pytest.mark.asyncio
 async def test_get_messages_always_checks_ownership(memory: SupabaseChatMemory):
     """Test that get_messages_async always calls _check_session_ownership_async when user_id provided"""
     mock_client = MagicMock()
@@ -182,9 +172,7 @@ async def test_get_messages_always_checks_ownership(memory: SupabaseChatMemory):
     order_mock = MagicMock()
 
     async def mock_messages_execute():
-        result = MagicMock()
-        result.data = []
-        return result
+        return MagicMock(data=[])
 
     order_mock.execute = mock_messages_execute
 
@@ -204,7 +192,6 @@ async def test_get_messages_always_checks_ownership(memory: SupabaseChatMemory):
     memory._check_session_ownership_async.assert_called_once_with(session_id, user_id, mock_client)
 
 
-@pytest.mark.asyncio
 async def test_get_message_count_always_checks_ownership(memory: SupabaseChatMemory):
     """Test that get_message_count_async always calls _check_session_ownership_async when user_id provided"""
     mock_client = MagicMock()
@@ -218,10 +205,7 @@ async def test_get_message_count_always_checks_ownership(memory: SupabaseChatMem
     eq_mock = MagicMock()
 
     async def mock_count_execute():
-        result = MagicMock()
-        result.count = 5
-        result.data = []
-        return result
+        return MagicMock(count=5, data=[])
 
     eq_mock.execute = mock_count_execute
 
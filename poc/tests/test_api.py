@@ -1,10 +1,5 @@
-from fastapi.testclient import TestClient
-from src.api.app import app
-
-client = TestClient(app)
-
-def test_health_check() -> None:
+async def test_health_check(async_client) -> None:
     """Test the /health endpoint returns 200 OK and correct status."""
-    response = client.get("/health")
+    response = await async_client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
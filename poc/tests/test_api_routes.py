@@ -12,8 +12,20 @@ from fastapi import FastAPI
 from langchain_core.messages import HumanMessage, AIMessage
 
 
+# 인증된 사용자 / 헤더 (테스트 간 공유하는 불변 값, 고정 값이므로 검증 생략)
+CURRENT_USER = User.model_construct(
+    id="user-1",
+    aud="authenticated",
+    role="authenticated",
+    email="test@example.com",
+    created_at="2024-01-01T00:00:00Z",
+    updated_at="2024-01-01T00:00:00Z",
+)
+AUTH_HEADERS = {"Authorization": "Bearer user-1"}
+
+
 @pytest.fixture
-def app():
+def app(_cache_typed_signatures):
     """FastAPI 앱 인스턴스"""
     app = FastAPI()
     app.include_router(router)
@@ -28,22 +40,19 @@ def client(app):
 
 
 @pytest.fixture
-def auth_overrides(app):
-    """인증/클라이언트 의존성 오버라이드"""
+def auth_overrides(app, client):
+    """인증/클라이언트 의존성 오버라이드 + 클라이언트 기본 Authorization 헤더 설정"""
+    client.headers.update(AUTH_HEADERS)
     mock_client = AsyncMock()
     mock_client.postgrest = MagicMock()
 
-    app.dependency_overrides[verify_current_user] = lambda: User(
-        id="user-1",
-        aud="authenticated",
-        role="authenticated",
-        email="test@example.com",
-        created_at="2024-01-01T00:00:00Z",
-        updated_at="2024-01-01T00:00:00Z",
-    )
+    app.dependency_overrides[verify_current_user] = lambda: CURRENT_USER
     app.dependency_overrides[get_user_scoped_client] = lambda: mock_client
-    yield mock_client
-    app.dependency_overrides = {}
+    try:
+        yield mock_client
+    finally:
+        app.dependency_overrides.pop(verify_current_user, None)
+        app.dependency_overrides.pop(get_user_scoped_client, None)
 
 
 class TestSessionEndpointsWithUserID:
@@ -81,7 +90,7 @@ class TestSessionEndpointsWithUserID:
         app.state.memory = mock_supabase_memory
         mock_supabase_memory.list_sessions_async.return_value = ["session-1", "session-2"]
 
-        response = client.get("/sessions", headers={"Authorization": "Bearer user-1"})
+        response = client.get("/sessions")
 
         assert response.status_code == 200
         data = response.json()
@@ -108,7 +117,7 @@ class TestSessionEndpointsWithUserID:
         app.state.memory = mock_supabase_memory
         mock_supabase_memory.list_sessions_async.return_value = ["session-1"]
 
-        response = client.delete("/sessions/session-1", headers={"Authorization": "Bearer user-1"})
+        response = client.delete("/sessions/session-1")
 
         assert response.status_code == 200
         data = response.json()
@@ -151,7 +160,7 @@ class TestSessionEndpointsWithUserID:
         ]
         mock_supabase_memory.get_messages_async.return_value = mock_messages
 
-        response = client.get("/sessions/session-1/messages", headers={"Authorization": "Bearer user-1"})
+        response = client.get("/sessions/session-1/messages")
 
         assert response.status_code == 200
         data = response.json()
@@ -209,7 +218,7 @@ class TestSessionEndpointsWithInMemory:
     def test_list_sessions_with_inmemory(self, client, mock_inmemory, auth_overrides, app):
         """InMemory 백엔드로 세션 목록 조회"""
         app.state.memory = mock_inmemory
-        response = client.get("/sessions", headers={"Authorization": "Bearer user-1"})
+        response = client.get("/sessions")
 
         assert response.status_code == 200
         mock_inmemory.list_sessions_async.assert_called_once()
@@ -217,7 +226,7 @@ class TestSessionEndpointsWithInMemory:
     def test_delete_session_with_inmemory(self, client, mock_inmemory, auth_overrides, app):
         """InMemory 백엔드로 세션 삭제"""
         app.state.memory = mock_inmemory
-        response = client.delete("/sessions/session-1", headers={"Authorization": "Bearer user-1"})
+        response = client.delete("/sessions/session-1")
 
         assert response.status_code == 200
         mock_inmemory.delete_session_async.assert_called_once()
@@ -231,7 +240,7 @@ class TestSessionEndpointsWithInMemory:
         ]
         mock_inmemory.get_messages_async = AsyncMock(return_value=mock_messages)
 
-        response = client.get("/sessions/session-1/messages", headers={"Authorization": "Bearer user-1"})
+        response = client.get("/sessions/session-1/messages")
 
         assert response.status_code == 200
         data = response.json()
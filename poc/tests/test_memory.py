@@ -182,7 +182,6 @@ class TestSupervisorWithMemory:
         supervisor = Supervisor()
         assert isinstance(supervisor.memory, InMemoryChatMemory)
 
-    @pytest.mark.asyncio
     async def test_build_messages_includes_history(self):
         """_build_messages가 히스토리를 포함하는지 확인"""
         from src.supervisor import Supervisor
@@ -201,7 +200,6 @@ class TestSupervisorWithMemory:
         assert messages[2].content == "이전 답변"
         assert messages[3].content == "새 질문"
 
-    @pytest.mark.asyncio
     async def test_build_messages_passes_client_to_memory(self):
         """_build_messages가 user-scoped client를 메모리에 전달하는지 확인"""
         from src.supervisor import Supervisor
@@ -226,7 +224,6 @@ class TestSupervisorWithMemory:
 class TestSupabaseMemoryGuard:
     """SupabaseChatMemory의 user-scoped client 강제 확인"""
 
-    @pytest.mark.asyncio
     async def test_requires_user_scoped_client_when_enabled(self):
         from src.memory.supabase_memory import SupabaseChatMemory
 
@@ -239,7 +236,6 @@ class TestSupabaseMemoryGuard:
         with pytest.raises(ValueError):
             await memory.get_messages_async("session-1", user_id="user-1", client=None)
 
-    @pytest.mark.asyncio
     async def test_save_to_history_async_adds_to_memory(self):
         """_save_to_history_async가 메모리에 저장하는지 확인"""
         from src.supervisor import Supervisor
@@ -254,7 +250,6 @@ class TestSupabaseMemoryGuard:
         assert messages[0].content == "질문"
         assert messages[1].content == "답변"
 
-    @pytest.mark.asyncio
     async def test_multiple_sessions_isolated(self):
         """여러 세션이 서로 격리되는지 확인"""
         from src.supervisor import Supervisor
@@ -275,7 +270,6 @@ class TestSupabaseMemoryGuard:
         assert messages_1[1].content == "질문1"
         assert messages_2[1].content == "질문2"
 
-    @pytest.mark.asyncio
     async def test_build_messages_without_session_no_history(self):
         """session_id 없이 호출 시 히스토리 없음 (process 메서드 동작)"""
         from src.supervisor import Supervisor
@@ -316,17 +310,14 @@ class TestSupabaseChatMemory:
         """SupabaseChatMemory는 ChatMemory 구현체"""
         assert isinstance(memory, ChatMemory)
 
-    @pytest.mark.asyncio
     async def test_get_messages_async_filters_by_ownership(self, memory, mock_async_client):
         """user_id가 제공되면 세션 소유권 검증"""
-        session_check = MagicMock()
-        session_check.data = [{"id": "session-1", "user_id": "user-1"}]
+        session_check = MagicMock(data=[{"id": "session-1", "user_id": "user-1"}])
         mock_async_client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
             return_value=session_check
         )
 
-        messages_response = MagicMock()
-        messages_response.data = []
+        messages_response = MagicMock(data=[])
         mock_async_client.table.return_value.select.return_value.eq.return_value.order.return_value.execute = AsyncMock(
             return_value=messages_response
         )
@@ -336,11 +327,9 @@ class TestSupabaseChatMemory:
         assert mock_async_client.table.called
         assert messages == []
 
-    @pytest.mark.asyncio
     async def test_get_messages_async_denies_wrong_user(self, memory, mock_async_client):
         """잘못된 user_id로는 SessionAccessDenied 발생"""
-        session_check = MagicMock()
-        session_check.data = []
+        session_check = MagicMock(data=[])
         mock_async_client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
             return_value=session_check
         )
@@ -348,11 +337,9 @@ class TestSupabaseChatMemory:
         with pytest.raises(SessionAccessDenied):
             await memory.get_messages_async("session-1", user_id="wrong-user")
 
-    @pytest.mark.asyncio
     async def test_list_sessions_async_filters_by_user_id(self, memory, mock_async_client):
         """user_id가 제공되면 해당 사용자의 세션만 조회"""
-        mock_response = MagicMock()
-        mock_response.data = [{"id": "session-1"}, {"id": "session-2"}]
+        mock_response = MagicMock(data=[{"id": "session-1"}, {"id": "session-2"}])
 
         mock_table = mock_async_client.table.return_value
         mock_select = mock_table.select.return_value
@@ -365,11 +352,9 @@ class TestSupabaseChatMemory:
         mock_select.eq.assert_called_once_with("user_id", "user-1")
         assert sessions == ["session-1", "session-2"]
 
-    @pytest.mark.asyncio
     async def test_delete_session_async_with_ownership(self, memory, mock_async_client):
         """user_id가 제공되면 소유권 검증 후 삭제"""
-        session_check = MagicMock()
-        session_check.data = [{"id": "session-1", "user_id": "user-1"}]
+        session_check = MagicMock(data=[{"id": "session-1", "user_id": "user-1"}])
         mock_async_client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
             return_value=session_check
         )
@@ -382,11 +367,9 @@ class TestSupabaseChatMemory:
 
         assert mock_async_client.table.return_value.delete.called
 
-    @pytest.mark.asyncio
     async def test_clear_async_verifies_ownership(self, memory, mock_async_client):
         """user_id가 제공되면 세션 소유권 검증 후 메시지 삭제"""
-        session_check = MagicMock()
-        session_check.data = [{"id": "session-1", "user_id": "user-1"}]
+        session_check = MagicMock(data=[{"id": "session-1", "user_id": "user-1"}])
         mock_async_client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
             return_value=session_check
         )
@@ -399,11 +382,9 @@ class TestSupabaseChatMemory:
 
         assert mock_async_client.table.return_value.select.called
 
-    @pytest.mark.asyncio
     async def test_clear_async_denies_wrong_user(self, memory, mock_async_client):
         """잘못된 user_id로는 clear 시 SessionAccessDenied 발생"""
-        session_check = MagicMock()
-        session_check.data = []
+        session_check = MagicMock(data=[])
         mock_async_client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
             return_value=session_check
         )
@@ -411,11 +392,9 @@ class TestSupabaseChatMemory:
         with pytest.raises(SessionAccessDenied):
             await memory.clear_async("session-1", user_id="wrong-user")
 
-    @pytest.mark.asyncio
     async def test_save_conversation_async_preserves_metadata(self, memory, mock_async_client):
         """비동기 save_conversation이 메타데이터를 보존"""
-        session_check = MagicMock()
-        session_check.data = [{"id": "session-1", "user_id": "user-1"}]
+        session_check = MagicMock(data=[{"id": "session-1", "user_id": "user-1"}])
 
         mock_async_client.table.return_value.select.return_value.eq.return_value.execute = AsyncMock(
             return_value=session_check
@@ -441,17 +420,14 @@ class TestSupabaseChatMemory:
 
         assert mock_async_client.table.return_value.insert.call_count >= 2
 
-    @pytest.mark.asyncio
     async def test_get_message_count_async_verifies_ownership(self, memory, mock_async_client):
         """user_id가 제공되면 세션 소유권 검증 후 개수 조회"""
-        session_check = MagicMock()
-        session_check.data = [{"id": "session-1", "user_id": "user-1"}]
+        session_check = MagicMock(data=[{"id": "session-1", "user_id": "user-1"}])
         mock_async_client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
             return_value=session_check
         )
 
-        count_response = MagicMock()
-        count_response.count = 5
+        count_response = MagicMock(count=5)
         mock_async_client.table.return_value.select.return_value.eq.return_value.execute = AsyncMock(
             return_value=count_response
         )
@@ -460,11 +436,9 @@ class TestSupabaseChatMemory:
 
         assert count == 5
 
-    @pytest.mark.asyncio
     async def test_get_message_count_async_raises_for_wrong_user(self, memory, mock_async_client):
         """잘못된 user_id로는 SessionAccessDenied 발생"""
-        session_check = MagicMock()
-        session_check.data = []
+        session_check = MagicMock(data=[])
         mock_async_client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
             return_value=session_check
         )
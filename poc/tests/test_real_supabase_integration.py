@@ -88,7 +88,6 @@ def test_session_id() -> str:
 class TestRealSupabaseIntegration:
     """실제 Supabase 데이터베이스 통합 테스트"""
 
-    @pytest.mark.asyncio
     async def test_session_creation_and_message_storage(
         self, memory, test_session_id, setup_users, async_client
     ):
@@ -119,7 +118,6 @@ class TestRealSupabaseIntegration:
         finally:
             await memory.delete_session_async(test_session_id, user_id=test_user_id, client=async_client)
 
-    @pytest.mark.asyncio
     async def test_multiple_conversations_history(
         self, memory, test_session_id, setup_users, async_client
     ):
@@ -149,7 +147,6 @@ class TestRealSupabaseIntegration:
         finally:
             await memory.delete_session_async(test_session_id, user_id=test_user_id, client=async_client)
 
-    @pytest.mark.asyncio
     async def test_user_isolation(self, memory, setup_users, async_client):
         """사용자 간 데이터 격리 테스트"""
         user1_id, user2_id = setup_users
@@ -176,7 +173,6 @@ class TestRealSupabaseIntegration:
             await memory.delete_session_async(session1_id, user_id=user1_id, client=async_client)
             await memory.delete_session_async(session2_id, user_id=user2_id, client=async_client)
 
-    @pytest.mark.asyncio
     async def test_session_clear(self, memory, test_session_id, setup_users, async_client):
         """세션 메시지 정리 테스트"""
         test_user_id = setup_users[0]
@@ -195,7 +191,6 @@ class TestRealSupabaseIntegration:
         finally:
             await memory.delete_session_async(test_session_id, user_id=test_user_id, client=async_client)
 
-    @pytest.mark.asyncio
     async def test_metadata_preservation(self, memory, test_session_id, setup_users, async_client):
         """메타데이터 보존 테스트"""
         test_user_id = setup_users[0]
@@ -220,13 +215,11 @@ class TestRealSupabaseIntegration:
 class TestSupabaseConnectionHealth:
     """Supabase 연결 상태 테스트"""
 
-    @pytest.mark.asyncio
     async def test_connection_works(self, memory, async_client):
         """기본 연결 테스트"""
         sessions = await memory.list_sessions_async(client=async_client)
         assert isinstance(sessions, list)
 
-    @pytest.mark.asyncio
     async def test_table_schema(self, memory, test_session_id, setup_users, async_client):
         """테이블 스키마가 올바르게 설정되었는지 테스트"""
         test_user_id = setup_users[0]
@@ -1,4 +1,5 @@
 """RESTful API 테스트 (세션 중심 설계)"""
+import json
 import uuid
 
 import pytest
@@ -16,8 +17,26 @@ from fastapi import FastAPI
 from langchain_core.messages import HumanMessage, AIMessage
 
 
+# 인증된 사용자 / 헤더 (테스트 간 공유하는 불변 값, 고정 값이므로 검증 생략)
+CURRENT_USER = User.model_construct(
+    id="user-1",
+    aud="authenticated",
+    role="authenticated",
+    email="test@example.com",
+    created_at="2024-01-01T00:00:00Z",
+    updated_at="2024-01-01T00:00:00Z",
+)
+AUTH_HEADERS = {"Authorization": "Bearer user-1"}
+
+# 여러 테스트에서 반복되는 메시지 요청 본문 (한 번만 직렬화)
+JSON_HEADERS = {"Content-Type": "application/json"}
+HELLO_BODY = json.dumps({"message": "Hello"}).encode()
+HELLO_STREAM_BODY = json.dumps({"message": "Hello", "stream": True}).encode()
+HELLO_NO_STREAM_BODY = json.dumps({"message": "Hello", "stream": False}).encode()
+
+
 @pytest.fixture
-def app():
+def app(_cache_typed_signatures):
     """FastAPI 앱 인스턴스"""
     app = FastAPI()
     app.include_router(router)
@@ -33,22 +52,19 @@ def client(app):
 
 
 @pytest.fixture
-def auth_overrides(app):
-    """인증/클라이언트 의존성 오버라이드"""
+def auth_overrides(app, client):
+    """인증/클라이언트 의존성 오버라이드 + 클라이언트 기본 Authorization 헤더 설정"""
+    client.headers.update(AUTH_HEADERS)
     mock_client = AsyncMock()
     mock_client.postgrest = MagicMock()
 
-    app.dependency_overrides[verify_current_user] = lambda: User(
-        id="user-1",
-        aud="authenticated",
-        role="authenticated",
-        email="test@example.com",
-        created_at="2024-01-01T00:00:00Z",
-        updated_at="2024-01-01T00:00:00Z",
-    )
+    app.dependency_overrides[verify_current_user] = lambda: CURRENT_USER
     app.dependency_overrides[get_user_scoped_client] = lambda: mock_client
-    yield mock_client
-    app.dependency_overrides = {}
+    try:
+        yield mock_client
+    finally:
+        app.dependency_overrides.pop(verify_current_user, None)
+        app.dependency_overrides.pop(get_user_scoped_client, None)
 
 
 class TestSessionCreation:
@@ -62,7 +78,7 @@ class TestSessionCreation:
         mock_memory.init_session_async = AsyncMock()
         app.state.memory = mock_memory
 
-        response = client.post("/sessions", headers={"Authorization": "Bearer user-1"})
+        response = client.post("/sessions")
 
         assert response.status_code == 200
         data = response.json()
@@ -89,7 +105,7 @@ class TestSessionCreation:
         mock_memory.init_session_async = AsyncMock()
         app.state.memory = mock_memory
 
-        response = client.post("/sessions", headers={"Authorization": "Bearer user-1"})
+        response = client.post("/sessions")
 
         assert response.status_code == 200
         data = response.json()
@@ -107,10 +123,7 @@ class TestSessionCreation:
         mock_memory.init_session_async = AsyncMock(return_value=True)
         app.state.memory = mock_memory
 
-        response = client.post(
-            "/sessions",
-            headers={"Authorization": "Bearer user-1"}
-        )
+        response = client.post("/sessions")
 
         assert response.status_code == 200
         data = response.json()
@@ -130,10 +143,7 @@ class TestSessionCreation:
         mock_memory.init_session_async = AsyncMock(return_value=False)
         app.state.memory = mock_memory
 
-        response = client.post(
-            "/sessions",
-            headers={"Authorization": "Bearer user-1"}
-        )
+        response = client.post("/sessions")
 
         assert response.status_code == 500
         data = response.json()
@@ -186,10 +196,7 @@ class TestSessionDetail:
         ]
         mock_supabase_memory.get_messages_async.return_value = mock_messages
 
-        response = client.get(
-            f"/sessions/{session_id}",
-            headers={"Authorization": "Bearer user-1"}
-        )
+        response = client.get(f"/sessions/{session_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -216,10 +223,7 @@ class TestSessionDetail:
 
         mock_supabase_memory.get_message_count_async.side_effect = SessionAccessDenied("denied")
 
-        response = client.get(
-            f"/sessions/{session_id}",
-            headers={"Authorization": "Bearer user-1"}
-        )
+        response = client.get(f"/sessions/{session_id}")
 
         assert response.status_code == 404
         data = response.json()
@@ -246,7 +250,7 @@ class TestSessionDetail:
             ),
         ])
 
-        response = client.get(f"/sessions/{session_id}", headers={"Authorization": "Bearer user-1"})
+        response = client.get(f"/sessions/{session_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -289,8 +293,8 @@ class TestSendMessage:
 
         response = client.post(
             f"/sessions/{session_id}/messages",
-            json={"message": "Hello", "stream": False},
-            headers={"Authorization": "Bearer user-1"}
+            content=HELLO_NO_STREAM_BODY,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -322,8 +326,8 @@ class TestSendMessage:
 
         response = client.post(
             f"/sessions/{session_id}/messages",
-            json={"message": "Hello", "stream": True},
-            headers={"Authorization": "Bearer user-1"}
+            content=HELLO_STREAM_BODY,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -353,8 +357,7 @@ class TestSendMessage:
         # stream 파라미터 없이 요청
         response = client.post(
             f"/sessions/{session_id}/messages",
-            json={"message": "Test"},
-            headers={"Authorization": "Bearer user-1"}
+            json={"message": "Test"}
         )
 
         assert response.status_code == 200
@@ -367,7 +370,8 @@ class TestSendMessage:
 
         response = client.post(
             f"/sessions/{session_id}/messages",
-            json={"message": "Hello"}
+            content=HELLO_BODY,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 401
@@ -392,8 +396,8 @@ class TestSendMessage:
 
         response = client.post(
             f"/sessions/{session_id}/messages",
-            json={"message": "Hello"},
-            headers={"Authorization": "Bearer user-1"}
+            content=HELLO_BODY,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -413,8 +417,8 @@ class TestSendMessage:
 
         response = client.post(
             f"/sessions/{session_id}/messages",
-            json={"message": "Hello", "stream": True},
-            headers={"Authorization": "Bearer user-1"}
+            content=HELLO_STREAM_BODY,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -431,8 +435,8 @@ class TestSendMessage:
 
         response = client.post(
             f"/sessions/{session_id}/messages",
-            json={"message": "Hello", "stream": False},
-            headers={"Authorization": "Bearer user-1"}
+            content=HELLO_NO_STREAM_BODY,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 400
@@ -1,5 +1,6 @@
 """Supabase 통합 테스트 - 세션 관리 및 히스토리 보존 검증"""
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from langchain_core.messages import HumanMessage, AIMessage
 from postgrest.exceptions import APIError
@@ -9,10 +10,16 @@ from src.memory.supabase_memory import SupabaseChatMemory, SessionAccessDenied
 
 @pytest.fixture
 def mock_supabase_client():
-    """Mock Supabase AsyncClient with realistic behavior"""
+    """Mock Supabase AsyncClient with realistic behavior
+
+    테이블 상태는 fixture 본문 안에서 생성되므로 테스트마다 독립적이며,
+    pytest-xdist 워커 간에도 공유되지 않는다.
+    """
     mock_client = MagicMock()
 
+    # 테스트별 in-memory 테이블 (모듈 전역 상태 금지)
     sessions_db = {}
+    sessions_by_user = {}  # user_id -> {session_id: None} (삽입 순서를 유지하는 user_id 인덱스)
     messages_db = []
 
     def table_handler(table_name):
@@ -24,28 +31,28 @@ def mock_supabase_client():
                 select_mock = MagicMock()
                 filter_state = {"user_id": None}
 
+                def project(rows):
+                    """select("id") 조회는 id 컬럼만 반환"""
+                    if fields == "id":
+                        return [{"id": row["id"]} for row in rows]
+                    return list(rows)
+
                 def eq_handler(field, value):
                     eq_mock = MagicMock()
 
                     if field == "id":
                         async def execute_select():
-                            result = MagicMock()
                             if value in sessions_db:
-                                result.data = [sessions_db[value]]
-                            else:
-                                result.data = []
-                            return result
+                                return SimpleNamespace(data=project([sessions_db[value]]))
+                            return SimpleNamespace(data=[])
 
                         def eq_user_handler(field2, value2):
                             eq2_mock = MagicMock()
 
                             async def execute_select_with_user():
-                                result = MagicMock()
                                 if value in sessions_db and sessions_db[value].get("user_id") == value2:
-                                    result.data = [sessions_db[value]]
-                                else:
-                                    result.data = []
-                                return result
+                                    return SimpleNamespace(data=project([sessions_db[value]]))
+                                return SimpleNamespace(data=[])
 
                             eq2_mock.execute = execute_select_with_user
                             return eq2_mock
@@ -60,13 +67,11 @@ def mock_supabase_client():
                             order_mock = MagicMock()
 
                             async def execute_list_filtered():
-                                result = MagicMock()
                                 filtered_sessions = [
-                                    s for s in sessions_db.values()
-                                    if s.get("user_id") == filter_state["user_id"]
+                                    sessions_db[sid]
+                                    for sid in sessions_by_user.get(filter_state["user_id"], ())
                                 ]
-                                result.data = filtered_sessions
-                                return result
+                                return SimpleNamespace(data=project(filtered_sessions))
 
                             order_mock.execute = execute_list_filtered
                             return order_mock
@@ -79,9 +84,7 @@ def mock_supabase_client():
                     order_mock = MagicMock()
 
                     async def execute_list():
-                        result = MagicMock()
-                        result.data = list(sessions_db.values())
-                        return result
+                        return SimpleNamespace(data=project(sessions_db.values()))
 
                     order_mock.execute = execute_list
                     return order_mock
@@ -101,13 +104,10 @@ def mock_supabase_client():
                             # Different user - raise 23505 (unique constraint violation)
                             raise APIError({"message": "duplicate key value violates unique constraint", "code": "23505", "details": None, "hint": None})
                         # Same user - idempotent operation, return existing
-                        result = MagicMock()
-                        result.data = [existing_session]
-                        return result
+                        return SimpleNamespace(data=[existing_session])
                     sessions_db[data["id"]] = data
-                    result = MagicMock()
-                    result.data = [data]
-                    return result
+                    sessions_by_user.setdefault(data.get("user_id"), {})[data["id"]] = None
+                    return SimpleNamespace(data=[data])
 
                 insert_mock.execute = execute_insert
                 return insert_mock
@@ -121,8 +121,7 @@ def mock_supabase_client():
                     async def execute_update():
                         if value in sessions_db:
                             sessions_db[value].update(data)
-                        result = MagicMock()
-                        return result
+                        return SimpleNamespace()
 
                     eq_mock.execute = execute_update
                     return eq_mock
@@ -138,11 +137,10 @@ def mock_supabase_client():
 
                     async def execute_delete():
                         if value in sessions_db:
-                            del sessions_db[value]
-                        nonlocal messages_db
-                        messages_db = [m for m in messages_db if m.get("session_id") != value]
-                        result = MagicMock()
-                        return result
+                            removed = sessions_db.pop(value)
+                            sessions_by_user.get(removed.get("user_id"), {}).pop(value, None)
+                        messages_db[:] = [m for m in messages_db if m.get("session_id") != value]
+                        return SimpleNamespace()
 
                     def eq_user_handler(field2, value2):
                         eq2_mock = MagicMock()
@@ -150,10 +148,9 @@ def mock_supabase_client():
                         async def execute_delete_with_user():
                             if value in sessions_db and sessions_db[value].get("user_id") == value2:
                                 del sessions_db[value]
-                                nonlocal messages_db
-                                messages_db = [m for m in messages_db if m.get("session_id") != value]
-                            result = MagicMock()
-                            return result
+                                sessions_by_user.get(value2, {}).pop(value, None)
+                                messages_db[:] = [m for m in messages_db if m.get("session_id") != value]
+                            return SimpleNamespace()
 
                         eq2_mock.execute = execute_delete_with_user
                         return eq2_mock
@@ -181,17 +178,13 @@ def mock_supabase_client():
                         order_mock = MagicMock()
 
                         async def execute_messages():
-                            result = MagicMock()
-                            result.data = [m for m in messages_db if m.get("session_id") == value]
-                            return result
+                            return SimpleNamespace(data=[m for m in messages_db if m.get("session_id") == value])
 
                         order_mock.execute = execute_messages
                         return order_mock
 
                     async def execute_count():
-                        result = MagicMock()
-                        result.count = len([m for m in messages_db if m.get("session_id") == value])
-                        return result
+                        return SimpleNamespace(count=len([m for m in messages_db if m.get("session_id") == value]))
 
                     eq_mock.order.side_effect = order_handler
                     eq_mock.execute = execute_count
@@ -205,9 +198,7 @@ def mock_supabase_client():
 
                 async def execute_insert():
                     messages_db.append(data)
-                    result = MagicMock()
-                    result.data = [data]
-                    return result
+                    return SimpleNamespace(data=[data])
 
                 insert_mock.execute = execute_insert
                 return insert_mock
@@ -219,10 +210,8 @@ def mock_supabase_client():
                     eq_mock = MagicMock()
 
                     async def execute_delete():
-                        nonlocal messages_db
-                        messages_db = [m for m in messages_db if m.get("session_id") != value]
-                        result = MagicMock()
-                        return result
+                        messages_db[:] = [m for m in messages_db if m.get("session_id") != value]
+                        return SimpleNamespace()
 
                     eq_mock.execute = execute_delete
                     return eq_mock
@@ -240,14 +229,17 @@ def mock_supabase_client():
     yield mock_client
 
 
+@pytest.fixture
+def memory(mock_supabase_client):
+    """Mock client에 연결된 SupabaseChatMemory"""
+    return SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
+
+
 class TestSupabaseSessionManagement:
     """세션 관리 통합 테스트"""
 
-    @pytest.mark.asyncio
-    async def test_session_lifecycle_with_user_id(self, mock_supabase_client):
+    async def test_session_lifecycle_with_user_id(self, memory):
         """사용자별 세션 생명주기 전체 테스트"""
-        memory = SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
-
         # 1. 새 세션에 메시지 추가 (세션 자동 생성)
         await memory.save_conversation_async(
             "session-1",
@@ -270,11 +262,8 @@ class TestSupabaseSessionManagement:
         assert messages[0].content == "첫 번째 질문"
         assert messages[1].content == "첫 번째 답변"
 
-    @pytest.mark.asyncio
-    async def test_multi_user_isolation(self, mock_supabase_client):
+    async def test_multi_user_isolation(self, memory):
         """다중 사용자 격리 테스트"""
-        memory = SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
-
         # User 1의 세션
         await memory.save_conversation_async(
             "session-user1",
@@ -309,11 +298,8 @@ class TestSupabaseSessionManagement:
         messages = await memory.get_messages_async("session-user2", user_id="user-2")
         assert len(messages) == 2
 
-    @pytest.mark.asyncio
-    async def test_session_history_preservation(self, mock_supabase_client):
+    async def test_session_history_preservation(self, memory):
         """세션 히스토리 보존 테스트"""
-        memory = SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
-
         # 여러 대화 추가
         conversations = [
             ("질문 1", "답변 1"),
@@ -347,11 +333,8 @@ class TestSupabaseSessionManagement:
         assert isinstance(messages[0], HumanMessage)
         assert isinstance(messages[1], AIMessage)
 
-    @pytest.mark.asyncio
-    async def test_metadata_preservation(self, mock_supabase_client):
+    async def test_metadata_preservation(self, memory):
         """메타데이터 보존 테스트"""
-        memory = SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
-
         # 커스텀 메타데이터와 함께 저장
         await memory.save_conversation_async(
             "session-metadata",
@@ -366,11 +349,8 @@ class TestSupabaseSessionManagement:
         count = await memory.get_message_count_async("session-metadata", user_id="user-1")
         assert count == 2
 
-    @pytest.mark.asyncio
-    async def test_unauthorized_access_denied(self, mock_supabase_client):
+    async def test_unauthorized_access_denied(self, memory):
         """권한 없는 접근 차단 테스트"""
-        memory = SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
-
         # User 2는 User 1의 세션에 접근 불가
         with pytest.raises(SessionAccessDenied):
             await memory.get_messages_async("session-user1", user_id="user-2")
@@ -379,11 +359,8 @@ class TestSupabaseSessionManagement:
         with pytest.raises(SessionAccessDenied):
             await memory.get_message_count_async("session-user1", user_id="user-2")
 
-    @pytest.mark.asyncio
-    async def test_clear_session_with_ownership(self, mock_supabase_client):
+    async def test_clear_session_with_ownership(self, memory):
         """소유권 검증 후 세션 정리 테스트"""
-        memory = SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
-
         # User 1의 세션 생성
         await memory.save_conversation_async(
             "session-clear-test", "질문", "답변", user_id="user-1"
@@ -396,11 +373,8 @@ class TestSupabaseSessionManagement:
         # User 1은 자신의 세션을 정리할 수 있음
         await memory.clear_async("session-clear-test", user_id="user-1")
 
-    @pytest.mark.asyncio
-    async def test_delete_session_with_ownership(self, mock_supabase_client):
+    async def test_delete_session_with_ownership(self, memory):
         """소유권 검증 후 세션 삭제 테스트"""
-        memory = SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
-
         # 세션 생성
         await memory.save_conversation_async(
             "session-del", "질문", "답변", user_id="user-1"
@@ -417,11 +391,8 @@ class TestSupabaseSessionManagement:
         sessions = await memory.list_sessions_async(user_id="user-1")
         assert "session-del" not in sessions
 
-    @pytest.mark.asyncio
-    async def test_cannot_write_to_other_users_session(self, mock_supabase_client):  # noqa: ARG002
+    async def test_cannot_write_to_other_users_session(self, memory):
         """다른 사용자의 세션에 메시지 작성 불가 테스트"""
-        memory = SupabaseChatMemory(url="http://test", key="test-key", async_client=mock_supabase_client)
-
         # User 1이 세션 생성
         await memory.save_conversation_async(
             "session-user1",
@@ -1,7 +1,9 @@
 """supervisor.py 테스트"""
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+from langchain_core.messages import AIMessage
 
 from src.supervisor.supervisor import (
     Supervisor,
@@ -12,8 +14,147 @@ from src.supervisor.supervisor import (
 )
 from src.schemas.models import StreamEventType
 
-# pytest-asyncio STRICT mode에서 async 테스트 마킹
-pytest_plugins = ('pytest_asyncio',)
+
+def replay(events):
+    """주어진 이벤트 목록을 그대로 yield하는 astream_events 대체 함수 생성"""
+    async def gen(*args, **kwargs):
+        for event in events:
+            yield event
+    return gen
+
+
+def respond(messages):
+    """주어진 메시지 목록을 결과로 반환하는 graph.ainvoke 대체 함수 생성"""
+    result = {"messages": list(messages)}
+
+    async def ainvoke(*args, **kwargs):
+        return result
+    return ainvoke
+
+
+async def take(agen, n):
+    """비동기 제너레이터에서 최대 n개까지만 수집하고 닫기"""
+    out = []
+    async for item in agen:
+        out.append(item)
+        if len(out) >= n:
+            break
+    await agen.aclose()
+    return out
+
+
+class StubLLM:
+    """bind_tools/ainvoke만 지원하는 최소 LLM 대체 객체"""
+
+    def __init__(self, resp=None):
+        self.resp = resp
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    async def ainvoke(self, *args, **kwargs):
+        return self.resp
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_chat():
+    """ChatOpenAI를 모듈 단위로 한 번만 patch"""
+    patcher = patch("src.adapters.openai.ChatOpenAI")
+    mock = patcher.start()
+    mock.return_value = StubLLM()
+    yield mock
+    patcher.stop()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_gemini_chat():
+    """ChatGoogleGenerativeAI를 모듈 단위로 한 번만 patch"""
+    patcher = patch("src.adapters.gemini.ChatGoogleGenerativeAI")
+    mock = patcher.start()
+    mock.return_value = StubLLM()
+    yield mock
+    patcher.stop()
+
+
+@pytest.fixture
+def supervisor():
+    """OpenAI 프로바이더 Supervisor (LLM 클래스는 모듈 fixture에서 patch됨)"""
+    return Supervisor(provider="openai")
+
+
+@pytest.fixture
+def gemini_supervisor(mock_gemini_chat):
+    """Gemini 프로바이더 Supervisor (ChatGoogleGenerativeAI는 모듈 fixture에서 patch됨)"""
+    return Supervisor(provider="gemini")
+
+
+# 스트리밍 청크 (process_stream/Adapter는 content, additional_kwargs만 읽음)
+Chunk = namedtuple("Chunk", ["content", "additional_kwargs"], defaults=[{}])
+
+
+def token_event(content):
+    """on_chat_model_stream 이벤트 생성"""
+    return {"event": "on_chat_model_stream", "data": {"chunk": Chunk(content)}}
+
+
+# 스트리밍 이벤트 payload (import 시 한 번만 생성, process_stream은 읽기만 함)
+TOKEN_EVT = token_event("테스트")
+# Gemini Native Thinking 형식: content가 list with thinking type
+THINK_EVT = token_event([{"type": "thinking", "thinking": "생각 내용"}])
+ACT_EVT = {"event": "on_tool_start", "name": "aweb_search", "data": {"input": {"query": "검색어"}}}
+OBSERVE_EVT = {"event": "on_tool_end", "name": "aweb_search", "data": {"output": "Web search 결과"}}
+# think는 SEARCH_TOOLS에 없음
+THINK_TOOL_END_EVT = {"event": "on_tool_end", "name": "think", "data": {"output": "생각 결과"}}
+HELLO_EVT = token_event("Hello ")
+WORLD_EVT = token_event("World")
+HELLO_WORLD_STREAM = (HELLO_EVT, WORLD_EVT)
+# OpenAI 형식: chunk.content = str
+OPENAI_CHUNK_EVT = token_event("안녕하세요")
+# Gemini 형식: chunk.content = list[dict]
+GEMINI_CHUNK_EVT = token_event([{"type": "text", "text": "안녕"}, {"type": "text", "text": "하세요"}])
+
+# 테스트용 AIMessage (pydantic 검증을 import 시 한 번만 수행)
+THINK_AI = AIMessage(content="", tool_calls=[{"name": "think", "args": {}, "id": "1"}])
+THINK_AI_2 = AIMessage(content="", tool_calls=[{"name": "think", "args": {}, "id": "2"}])
+SEARCH_AI = AIMessage(content="", tool_calls=[{"name": "aweb_search", "args": {"query": "test"}, "id": "3"}])
+FINAL_AI = AIMessage(content="답변입니다")
+LONG_AI = AIMessage(content="긴 응답 내용입니다" * 20)
+
+# (Supervisor fixture 이름, 입력 이벤트 tuple, 기대 출력 이벤트 목록)
+STREAM_FORMAT_CASES = [
+    pytest.param(
+        "supervisor", (TOKEN_EVT,),
+        [{"type": StreamEventType.TOKEN, "content": "테스트"}],
+        id="token",
+    ),
+    pytest.param(
+        "gemini_supervisor", (THINK_EVT,),
+        [{"type": StreamEventType.THINK, "content": "생각 내용"}],
+        id="think",
+    ),
+    pytest.param(
+        "supervisor", (ACT_EVT,),
+        [{"type": StreamEventType.ACT, "tool": "aweb_search", "args": {"query": "검색어"}}],
+        id="act",
+    ),
+    pytest.param(
+        "supervisor", (OBSERVE_EVT,),
+        [{"type": StreamEventType.OBSERVE, "content": "Web search 결과"}],
+        id="observe",
+    ),
+    # think의 on_tool_end는 무시되어야 함
+    pytest.param("supervisor", (THINK_TOOL_END_EVT,), [], id="ignores_non_search_tool_end"),
+    # 토큰 스트리밍 → 검색 도구 호출 → 도구 결과 (Native Thinking은 OpenAI에서 지원하지 않음)
+    pytest.param(
+        "supervisor", (TOKEN_EVT, ACT_EVT, OBSERVE_EVT),
+        [
+            {"type": StreamEventType.TOKEN, "content": "테스트"},
+            {"type": StreamEventType.ACT, "tool": "aweb_search", "args": {"query": "검색어"}},
+            {"type": StreamEventType.OBSERVE, "content": "Web search 결과"},
+        ],
+        id="token_act_observe",
+    ),
+]
 
 
 class TestSupervisorConstants:
@@ -36,76 +177,43 @@ class TestSupervisorConstants:
 class TestSupervisorInit:
     """Supervisor 초기화 테스트"""
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_default_initialization(self, mock_chat):
+    def test_default_initialization(self, supervisor):
         """기본 초기화 테스트"""
-        mock_chat.return_value = MagicMock()
-        mock_chat.return_value.bind_tools = MagicMock(return_value=MagicMock())
-
-        supervisor = Supervisor(provider="openai")
-
         assert supervisor.max_steps == DEFAULT_MAX_STEPS
         assert supervisor.max_tokens == DEFAULT_MAX_TOKENS
         assert supervisor.adapter.provider_name == "openai"
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_custom_initialization(self, mock_chat):
+    def test_custom_initialization(self):
         """커스텀 파라미터 초기화 테스트"""
-        mock_chat.return_value = MagicMock()
-        mock_chat.return_value.bind_tools = MagicMock(return_value=MagicMock())
-
         supervisor = Supervisor(max_steps=5, max_tokens=2048, provider="openai")
 
         assert supervisor.max_steps == 5
         assert supervisor.max_tokens == 2048
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_openai_adapter_selected(self, mock_chat):
+    def test_openai_adapter_selected(self, supervisor):
         """provider=openai일 때 OpenAI Adapter 선택"""
-        mock_chat.return_value = MagicMock()
-        mock_chat.return_value.bind_tools = MagicMock(return_value=MagicMock())
-
-        supervisor = Supervisor(provider="openai")
         assert supervisor.adapter.provider_name == "openai"
 
-    @patch("src.adapters.gemini.ChatGoogleGenerativeAI")
-    def test_gemini_adapter_selected(self, mock_chat):
+    @pytest.mark.xdist_group("supervisor_gemini")
+    def test_gemini_adapter_selected(self, gemini_supervisor):
         """provider=gemini일 때 Gemini Adapter 선택"""
-        mock_chat.return_value = MagicMock()
-        mock_chat.return_value.bind_tools = MagicMock(return_value=MagicMock())
-
-        supervisor = Supervisor(provider="gemini")
-        assert supervisor.adapter.provider_name == "gemini"
+        assert gemini_supervisor.adapter.provider_name == "gemini"
 
 
 class TestSupervisorShouldContinue:
     """_should_continue 메서드 테스트"""
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_continue_when_tool_calls_exist(self, mock_chat):
+    def test_continue_when_tool_calls_exist(self, supervisor):
         """tool_calls가 있으면 continue 반환"""
-        mock_chat.return_value = MagicMock()
-        mock_chat.return_value.bind_tools = MagicMock(return_value=MagicMock())
-
-        supervisor = Supervisor(provider="openai")
-
-        mock_message = MagicMock()
-        mock_message.tool_calls = [{"name": "think", "args": {}}]
+        mock_message = SimpleNamespace(tool_calls=[{"name": "think", "args": {}}])
         state = {"messages": [mock_message]}
 
         result = supervisor._should_continue(state)
         assert result == "continue"
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_end_when_no_tool_calls(self, mock_chat):
+    def test_end_when_no_tool_calls(self, supervisor):
         """tool_calls가 없으면 end 반환"""
-        mock_chat.return_value = MagicMock()
-        mock_chat.return_value.bind_tools = MagicMock(return_value=MagicMock())
-
-        supervisor = Supervisor(provider="openai")
-
-        mock_message = MagicMock()
-        mock_message.tool_calls = []
+        mock_message = SimpleNamespace(tool_calls=[])
         state = {"messages": [mock_message]}
 
         result = supervisor._should_continue(state)
@@ -115,17 +223,11 @@ class TestSupervisorShouldContinue:
 class TestSupervisorExtractSources:
     """_extract_sources 메서드 테스트"""
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_extracts_tool_names(self, mock_chat):
+    def test_extracts_tool_names(self, supervisor):
         """도구 이름들을 추출하는지 확인"""
-        mock_chat.return_value = MagicMock()
-        mock_chat.return_value.bind_tools = MagicMock(return_value=MagicMock())
-
-        supervisor = Supervisor(provider="openai")
-
         messages = [
-            AIMessage(content="", tool_calls=[{"name": "think", "args": {}, "id": "1"}]),
-            AIMessage(content="", tool_calls=[{"name": "aweb_search", "args": {}, "id": "2"}]),
+            THINK_AI,
+            SEARCH_AI,
         ]
 
         sources = supervisor._extract_sources(messages)
@@ -133,17 +235,11 @@ class TestSupervisorExtractSources:
         assert "think" in sources
         assert "aweb_search" in sources
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_returns_unique_sources(self, mock_chat):
+    def test_returns_unique_sources(self, supervisor):
         """중복 없이 반환하는지 확인"""
-        mock_chat.return_value = MagicMock()
-        mock_chat.return_value.bind_tools = MagicMock(return_value=MagicMock())
-
-        supervisor = Supervisor(provider="openai")
-
         messages = [
-            AIMessage(content="", tool_calls=[{"name": "think", "args": {}, "id": "1"}]),
-            AIMessage(content="", tool_calls=[{"name": "think", "args": {}, "id": "2"}]),
+            THINK_AI,
+            THINK_AI_2,
         ]
 
         sources = supervisor._extract_sources(messages)
@@ -151,242 +247,47 @@ class TestSupervisorExtractSources:
         assert sources.count("think") == 1
 
 
+@pytest.mark.xdist_group("supervisor_openai")
 class TestSupervisorProcessStream:
     """process_stream 메서드 테스트"""
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_stream_yields_events(self, mock_chat):
-        """스트리밍이 이벤트를 yield하는지 확인"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        # Mock graph의 astream_events
-        async def mock_stream_events(*args, **kwargs):
-            # 토큰 스트리밍 이벤트
-            yield {
-                "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content="Hello")}
-            }
-            # 검색 도구 호출 이벤트
-            yield {
-                "event": "on_tool_start",
-                "name": "aweb_search",
-                "data": {"input": {"query": "test query"}}
-            }
-            # 도구 결과 이벤트
-            yield {
-                "event": "on_tool_end",
-                "name": "aweb_search",
-                "data": {"output": "검색 결과..."}
-            }
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.astream_events = mock_stream_events
-
-        events = []
-        async for event in supervisor.process_stream("테스트 질문"):
-            events.append(event)
-
-        # 이벤트 타입 확인 (Native Thinking은 OpenAI에서 지원하지 않음)
-        event_types = [e["type"] for e in events]
-        assert StreamEventType.TOKEN in event_types
-        assert StreamEventType.ACT in event_types
-        assert StreamEventType.OBSERVE in event_types
-
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_stream_passes_client_to_build_messages(self, mock_chat):
+    async def test_process_stream_passes_client_to_build_messages(self, supervisor):
         """process_stream이 client를 _build_messages로 전달하는지 확인"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
         supervisor._build_messages = AsyncMock(return_value=[])
 
-        async def mock_stream_events(*args, **kwargs):
-            if False:
-                yield {}
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.astream_events = mock_stream_events
+        supervisor._cached_graph = SimpleNamespace(astream_events=replay(()))
 
         client = object()
-        async for _ in supervisor.process_stream("질문", session_id="session-1", user_id="user-1", client=client):
-            pass
+        stream = supervisor.process_stream("질문", session_id="session-1", user_id="user-1", client=client)
+        events = [event async for event in stream]
+
+        assert events == []
 
         supervisor._build_messages.assert_called_once_with(
             "session-1", "질문", user_id="user-1", client=client
         )
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_stream_token_event_format(self, mock_chat):
-        """토큰 이벤트 포맷 확인"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        async def mock_stream_events(*args, **kwargs):
-            yield {
-                "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content="테스트")}
-            }
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.astream_events = mock_stream_events
-
-        events = []
-        async for event in supervisor.process_stream("질문"):
-            events.append(event)
-
-        assert len(events) == 1
-        assert events[0]["type"] == StreamEventType.TOKEN
-        assert events[0]["content"] == "테스트"
-
-    @pytest.mark.asyncio
-    @patch("src.adapters.gemini.ChatGoogleGenerativeAI")
-    async def test_process_stream_think_event_format(self, mock_chat):
-        """native thinking 이벤트 포맷 확인 (Gemini)"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="gemini")
-
-        async def mock_stream_events(*args, **kwargs):
-            # Gemini Native Thinking 형식: content가 list with thinking type
-            chunk = MagicMock()
-            chunk.content = [{"type": "thinking", "thinking": "생각 내용"}]
-            chunk.additional_kwargs = {}
-            yield {
-                "event": "on_chat_model_stream",
-                "data": {"chunk": chunk}
-            }
+    @pytest.mark.parametrize("supervisor_fixture, stream, expected", STREAM_FORMAT_CASES)
+    async def test_process_stream_event_format(self, request, supervisor_fixture, stream, expected):
+        """이벤트 종류별 스트리밍 포맷 확인"""
+        supervisor = request.getfixturevalue(supervisor_fixture)
 
         # Gemini는 매번 새로 생성하므로 _build_graph를 mock
-        mock_graph = MagicMock()
-        mock_graph.astream_events = mock_stream_events
-        supervisor._build_graph = MagicMock(return_value=mock_graph)
-
-        events = []
-        async for event in supervisor.process_stream("질문"):
-            events.append(event)
-
-        assert len(events) == 1
-        assert events[0]["type"] == StreamEventType.THINK
-        assert events[0]["content"] == "생각 내용"
-
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_stream_act_event_format(self, mock_chat):
-        """act 이벤트 포맷 확인"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        async def mock_stream_events(*args, **kwargs):
-            yield {
-                "event": "on_tool_start",
-                "name": "aweb_search",
-                "data": {"input": {"query": "검색어"}}
-            }
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.astream_events = mock_stream_events
-
-        events = []
-        async for event in supervisor.process_stream("질문"):
-            events.append(event)
-
-        assert len(events) == 1
-        assert events[0]["type"] == StreamEventType.ACT
-        assert events[0]["tool"] == "aweb_search"
-        assert events[0]["args"] == {"query": "검색어"}
-
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_stream_observe_event_format(self, mock_chat):
-        """observe 이벤트 포맷 확인"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        async def mock_stream_events(*args, **kwargs):
-            yield {
-                "event": "on_tool_end",
-                "name": "aweb_search",
-                "data": {"output": "Web search 결과"}
-            }
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.astream_events = mock_stream_events
-
-        events = []
-        async for event in supervisor.process_stream("질문"):
-            events.append(event)
-
-        assert len(events) == 1
-        assert events[0]["type"] == StreamEventType.OBSERVE
-        assert "Web search 결과" in events[0]["content"]
-
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_stream_ignores_non_search_tool_end(self, mock_chat):
-        """검색 도구가 아닌 도구의 on_tool_end는 무시"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        async def mock_stream_events(*args, **kwargs):
-            yield {
-                "event": "on_tool_end",
-                "name": "think",  # think는 SEARCH_TOOLS에 없음
-                "data": {"output": "생각 결과"}
-            }
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.astream_events = mock_stream_events
-
-        events = []
-        async for event in supervisor.process_stream("질문"):
-            events.append(event)
-
-        # think의 on_tool_end는 무시되어야 함
-        assert len(events) == 0
-
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_stream_saves_to_history(self, mock_chat):
-        """스트리밍 완료 후 히스토리에 저장"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
+        mock_graph = SimpleNamespace(astream_events=replay(stream))
+        supervisor._build_graph = lambda: mock_graph
 
-        supervisor = Supervisor(provider="openai")
+        # 기대보다 하나 더 받아서 여분 이벤트가 있으면 실패하도록 함
+        events = await take(supervisor.process_stream("질문"), len(expected) + 1)
 
-        async def mock_stream_events(*args, **kwargs):
-            yield {"event": "on_chat_model_stream", "data": {"chunk": MagicMock(content="Hello ")}}
-            yield {"event": "on_chat_model_stream", "data": {"chunk": MagicMock(content="World")}}
+        assert events == expected
 
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.astream_events = mock_stream_events
+    async def test_process_stream_saves_to_history(self, supervisor):
+        """스트리밍 완료 후 히스토리에 저장"""
+        supervisor._cached_graph = SimpleNamespace(astream_events=replay(HELLO_WORLD_STREAM))
 
         # 스트리밍 실행
-        async for _ in supervisor.process_stream("테스트", session_id="test-session"):
-            pass
+        events = [event async for event in supervisor.process_stream("테스트", session_id="test-session")]
+        assert [e["content"] for e in events] == ["Hello ", "World"]
 
         # 히스토리 확인
         messages = supervisor.memory.get_messages("test-session")
@@ -395,50 +296,31 @@ class TestSupervisorProcessStream:
         assert messages[1].content == "Hello World"
 
 
+@pytest.mark.xdist_group("supervisor_openai")
 class TestSupervisorProcess:
     """process 메서드 테스트 (Non-streaming)"""
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_returns_supervisor_response(self, mock_chat):
+    async def test_process_returns_supervisor_response(self, supervisor):
         """process가 SupervisorResponse를 반환"""
+        from langchain_core.messages import HumanMessage, SystemMessage
         from src.schemas.models import SupervisorResponse
 
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        # Mock graph의 ainvoke
-        async def mock_ainvoke(*args, **kwargs):
-            return {"messages": [
-                SystemMessage(content="system"),
-                HumanMessage(content="질문"),
-                AIMessage(content="답변입니다")
-            ]}
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.ainvoke = mock_ainvoke
+        supervisor._cached_graph = SimpleNamespace(ainvoke=respond([
+            SystemMessage(content="system"),
+            HumanMessage(content="질문"),
+            FINAL_AI,
+        ]))
 
         result = await supervisor.process("테스트 질문")
 
         assert isinstance(result, SupervisorResponse)
         assert result.answer == "답변입니다"
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_passes_client_to_build_messages(self, mock_chat):
+    async def test_process_passes_client_to_build_messages(self, supervisor):
         """process가 client를 _build_messages로 전달하는지 확인"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
         supervisor._build_messages = AsyncMock(return_value=[])
 
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.ainvoke = AsyncMock(return_value={"messages": [AIMessage(content="ok")]})
+        supervisor._cached_graph = SimpleNamespace(ainvoke=respond([FINAL_AI]))
 
         client = object()
         await supervisor.process("질문", session_id="session-1", user_id="user-1", client=client)
@@ -447,65 +329,26 @@ class TestSupervisorProcess:
             "session-1", "질문", user_id="user-1", client=client
         )
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_extracts_sources(self, mock_chat):
+    async def test_process_extracts_sources(self, supervisor):
         """process가 사용된 도구를 sources에 포함"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        async def mock_ainvoke(*args, **kwargs):
-            return {"messages": [
-                AIMessage(content="", tool_calls=[{"name": "aweb_search", "args": {}, "id": "1"}]),
-                AIMessage(content="최종 답변")
-            ]}
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.ainvoke = mock_ainvoke
+        supervisor._cached_graph = SimpleNamespace(ainvoke=respond([SEARCH_AI, FINAL_AI]))
 
         result = await supervisor.process("질문")
 
         assert "aweb_search" in result.sources
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_saves_to_history_with_session(self, mock_chat):
+    async def test_process_saves_to_history_with_session(self, supervisor):
         """session_id가 있으면 히스토리에 저장"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        async def mock_ainvoke(*args, **kwargs):
-            return {"messages": [AIMessage(content="답변")]}
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.ainvoke = mock_ainvoke
+        supervisor._cached_graph = SimpleNamespace(ainvoke=respond([FINAL_AI]))
 
         await supervisor.process("질문", session_id="test-session")
 
         messages = supervisor.memory.get_messages("test-session")
         assert len(messages) == 2
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_process_no_history_without_session(self, mock_chat):
+    async def test_process_no_history_without_session(self, supervisor):
         """session_id가 없으면 히스토리 저장 안 함"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        async def mock_ainvoke(*args, **kwargs):
-            return {"messages": [AIMessage(content="답변")]}
-
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.ainvoke = mock_ainvoke
+        supervisor._cached_graph = SimpleNamespace(ainvoke=respond([FINAL_AI]))
 
         await supervisor.process("질문")  # session_id 없음
 
@@ -516,51 +359,26 @@ class TestSupervisorProcess:
 class TestSupervisorParseExecutionLog:
     """_parse_execution_log 메서드 테스트"""
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_parse_ai_message_content(self, mock_chat):
+    def test_parse_ai_message_content(self, supervisor):
         """AIMessage content를 로그에 포함"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        messages = [AIMessage(content="긴 응답 내용입니다" * 20)]
+        messages = [LONG_AI]
         log = supervisor._parse_execution_log(messages)
 
         assert len(log) == 1
         assert "Response:" in log[0]
         assert "..." in log[0]  # 100자 초과 시 truncate
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_parse_tool_calls(self, mock_chat):
+    def test_parse_tool_calls(self, supervisor):
         """tool_calls를 로그에 포함"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
-        messages = [
-            AIMessage(content="", tool_calls=[
-                {"name": "aweb_search", "args": {"query": "test"}, "id": "1"}
-            ])
-        ]
+        messages = [SEARCH_AI]
         log = supervisor._parse_execution_log(messages)
 
         assert any("Tool: aweb_search" in entry for entry in log)
 
-    @patch("src.adapters.openai.ChatOpenAI")
-    def test_parse_tool_message(self, mock_chat):
+    def test_parse_tool_message(self, supervisor):
         """ToolMessage를 로그에 포함"""
         from langchain_core.messages import ToolMessage
 
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
-
-        supervisor = Supervisor(provider="openai")
-
         messages = [ToolMessage(content="결과 데이터" * 100, tool_call_id="1")]
         log = supervisor._parse_execution_log(messages)
 
@@ -569,62 +387,38 @@ class TestSupervisorParseExecutionLog:
         assert "chars" in log[0]
 
 
-class TestChunkNormalization:
-    """청크 정규화 테스트 (Adapter 통합)"""
+class TestSupervisorNode:
+    """supervisor 노드 (실제 Graph) 테스트"""
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.openai.ChatOpenAI")
-    async def test_openai_chunk_normalized(self, mock_chat):
-        """OpenAI 청크가 정규화되어 스트리밍됨"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
+    async def test_supervisor_node_calls_llm(self, supervisor, mock_chat, monkeypatch):
+        """supervisor 노드가 바인딩된 LLM을 호출하고 응답을 반환"""
+        monkeypatch.setattr(mock_chat, "return_value", StubLLM(resp=FINAL_AI))
 
-        supervisor = Supervisor(provider="openai")
-
-        async def mock_stream_events(*args, **kwargs):
-            # OpenAI 형식: chunk.content = str
-            yield {
-                "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content="안녕하세요")}
-            }
+        result = await supervisor.process("질문")
 
-        supervisor._cached_graph = MagicMock()
-        supervisor._cached_graph.astream_events = mock_stream_events
+        assert result.answer == "답변입니다"
+        assert result.sources == []
 
-        events = []
-        async for event in supervisor.process_stream("질문"):
-            events.append(event)
 
-        assert events[0]["content"] == "안녕하세요"
+class TestChunkNormalization:
+    """청크 정규화 테스트 (Adapter 통합)"""
 
-    @pytest.mark.asyncio
-    @patch("src.adapters.gemini.ChatGoogleGenerativeAI")
-    async def test_gemini_chunk_normalized(self, mock_chat):
-        """Gemini 청크가 정규화되어 스트리밍됨"""
-        mock_llm = MagicMock()
-        mock_chat.return_value = mock_llm
-        mock_llm.bind_tools = MagicMock(return_value=mock_llm)
+    async def test_openai_chunk_normalized(self, supervisor):
+        """OpenAI 청크가 정규화되어 스트리밍됨"""
+        supervisor._cached_graph = SimpleNamespace(astream_events=replay((OPENAI_CHUNK_EVT,)))
 
-        supervisor = Supervisor(provider="gemini")
+        events = await take(supervisor.process_stream("질문"), 1)
 
-        async def mock_stream_events(*args, **kwargs):
-            # Gemini 형식: chunk.content = list[dict]
-            chunk = MagicMock()
-            chunk.content = [{"type": "text", "text": "안녕"}, {"type": "text", "text": "하세요"}]
-            yield {
-                "event": "on_chat_model_stream",
-                "data": {"chunk": chunk}
-            }
+        assert events[0]["content"] == "안녕하세요"
 
+    @pytest.mark.xdist_group("supervisor_gemini")
+    async def test_gemini_chunk_normalized(self, gemini_supervisor):
+        """Gemini 청크가 정규화되어 스트리밍됨"""
         # Gemini는 매번 새로 생성하므로 _build_graph를 mock
-        mock_graph = MagicMock()
-        mock_graph.astream_events = mock_stream_events
-        supervisor._build_graph = MagicMock(return_value=mock_graph)
+        mock_graph = SimpleNamespace(astream_events=replay((GEMINI_CHUNK_EVT,)))
+        gemini_supervisor._build_graph = lambda: mock_graph
 
-        events = []
-        async for event in supervisor.process_stream("질문"):
-            events.append(event)
+        events = await take(gemini_supervisor.process_stream("질문"), 1)
 
         # Gemini list 형식이 str로 정규화됨
         assert events[0]["content"] == "안녕하세요"
@@ -1,20 +1,25 @@
 """tools.py 테스트"""
-import pytest
+import pytest_asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.supervisor.tools import think, aweb_search, TOOLS
 
 
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def _warm_tools():
+    """도구 래퍼의 첫 호출 비용(인자 스키마, 콜백 매니저 초기화)을 모듈 단위로 한 번만 지불"""
+    await think.ainvoke({"thought": ""})
+
+
 class TestThinkTool:
     """think 도구 테스트"""
 
-    @pytest.mark.asyncio
     async def test_returns_input_thought(self):
         """입력한 생각을 그대로 반환하는지 확인"""
         thought = "이것은 테스트 생각입니다."
         result = await think.ainvoke({"thought": thought})
         assert result == thought
 
-    @pytest.mark.asyncio
     async def test_empty_thought(self):
         """빈 생각도 처리하는지 확인"""
         result = await think.ainvoke({"thought": ""})
@@ -38,13 +43,11 @@ class TestToolsList:
 class TestAwebSearch:
     """aweb_search 도구 테스트"""
 
-    @pytest.mark.asyncio
     async def test_returns_web_result_format(self):
         """웹 검색 결과 포맷 확인"""
         with patch("src.supervisor.tools._get_web_worker") as mock_get_worker:
             mock_worker = MagicMock()
-            mock_result = MagicMock()
-            mock_result.content = "테스트 웹 결과"
+            mock_result = SimpleNamespace(content="테스트 웹 결과")
             mock_worker.execute = AsyncMock(return_value=mock_result)
             mock_get_worker.return_value = mock_worker
 